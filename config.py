@@ -1,22 +1,17 @@
-import json
+from utils._config_loader import get_config
 
-with open("config.json", "r") as f:
-    config = json.load(f)
+config = get_config()
 
-ALLOWED_PATHS = config.get("ALLOWED_PATHS", None)
-EXCLUDE_PATHS = config.get("EXCLUDE_PATHS", [])
-DEFAULT_TIME_LIMIT = config.get("DEFAULT_TIME_LIMIT", 10)
-HIDE_HIDDEN_FILES = config.get("HIDE_HIDDEN_FILES", True)
+ALLOWED_PATHS = config.ALLOWED_PATHS
+EXCLUDE_PATHS = config.EXCLUDE_PATHS
+DEFAULT_TIME_LIMIT = config.DEFAULT_TIME_LIMIT
+HIDE_HIDDEN_FILES = config.HIDE_HIDDEN_FILES
+MAX_SCAN_FILE_SIZE = config.MAX_SCAN_FILE_SIZE
 
-PATH_MASKER = config.get("PATH_MASKER", {})
-PATH_MASKER_ENABLED = PATH_MASKER.get("ENABLED", False)
-PATH_MASKER_MODE = PATH_MASKER.get("MODE", "prefix")
-PATH_MASKER_MASK_TOKEN = PATH_MASKER.get("MASK_TOKEN", "MASK")
-PATH_MASKER_LOOK_FOR = PATH_MASKER.get("LOOK_FOR", [])
+PATH_MASKER_ENABLED = config.PATH_MASKER.ENABLED
+PATH_MASKER_MODE = config.PATH_MASKER.MODE
+PATH_MASKER_MASK_TOKEN = config.PATH_MASKER.MASK_TOKEN
+PATH_MASKER_LOOK_FOR = config.PATH_MASKER.LOOK_FOR
 
-HOST = config.get("HOST", "127.0.0.1")
-PORT = config.get("PORT", 6277)
-
-if not ALLOWED_PATHS:
-    raise ValueError("ALLOWED_PATHS must be specified in config.json")
-    
\ No newline at end of file
+HOST = config.HOST
+PORT = config.PORT
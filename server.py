@@ -1,4 +1,5 @@
 # server.py
+import re
 from os import curdir
 from mcp.server.fastmcp import FastMCP
 from typing import Optional, Union, Literal, Dict, List, Any
@@ -9,6 +10,7 @@ from config import (
     EXCLUDE_PATHS,
     HIDE_HIDDEN_FILES,
     DEFAULT_TIME_LIMIT,
+    MAX_SCAN_FILE_SIZE,
     PATH_MASKER_LOOK_FOR,
     PATH_MASKER_MODE,
     PATH_MASKER_MASK_TOKEN,
@@ -21,7 +23,8 @@ file_search_tools = FileSearchTool(
     allowed_paths=ALLOWED_PATHS,
     exclude_paths=EXCLUDE_PATHS,
     hide_hidden=HIDE_HIDDEN_FILES,
-    default_time_limit=DEFAULT_TIME_LIMIT
+    default_time_limit=DEFAULT_TIME_LIMIT,
+    max_scan_file_size=MAX_SCAN_FILE_SIZE
 )
 
 masker = PathMasker(
@@ -31,6 +34,17 @@ masker = PathMasker(
     enabled=PATH_MASKER_ENABLED
 )
 
+def _validate_regex_patterns(*pattern_lists: Optional[List[str]]) -> Optional[str]:
+    """Return an error message if any supplied pattern fails to compile, else None."""
+    for patterns in pattern_lists:
+        for p in patterns or []:
+            try:
+                re.compile(p)
+            except re.error as e:
+                return f"Invalid regex pattern `{p}`: {e}"
+    return None
+
+
 # Create an MCP server
 mcp = FastMCP(
     name="File Search Tool",
@@ -154,6 +168,7 @@ def search_file_name(
     time_limit: Optional[float] = None,
     max_nested_level: int = 1,
     search_mode: Literal["bfs", "dfs"] = "bfs",
+    limit: int = -1,
 ) -> Dict[str, Any]:
     """
     Search for files whose **path** match the given regex, level‑by‑level.
@@ -165,6 +180,7 @@ def search_file_name(
         time_limit (Optional[float]): Seconds after which to abort (-1 = no limit, None = default).
         max_nested_level (int): Depth to recurse: 0 = only root, 1 = root+its subdirs, -1 = unlimited.
         search_mode (str): Search mode: "bfs" (recommended) or "dfs".
+        limit (int): Maximum number of matches to return. Set to -1 for no limit.
 
     Returns:
         Dict: A dictionary with the following keys:
@@ -173,6 +189,9 @@ def search_file_name(
             - 'time_elapsed': Time elapsed in seconds.
             - 'response_message': A message indicating the result of the operation
     """
+    error = _validate_regex_patterns(regex_pattern, exclude_regex_patterns)
+    if error:
+        return return_message(results=None, success=False, response_message=error)
     base_path = masker.unmask_path(base_path)
     try:
         query_result = file_search_tools.search_file_name(
@@ -182,16 +201,20 @@ def search_file_name(
             time_limit=time_limit,
             max_nested_level=max_nested_level,
             search_mode=search_mode,
+            limit=limit,
         )
         results = query_result['results']
         results = masker.mask_multiple_paths(results)
         response_message = ""
         time_elapsed = query_result['time_elapsed']
         is_time_limit_exceeded = query_result['is_time_limit_exceeded']
-        
+        is_limit_exceeded = query_result['is_limit_exceeded']
+
         response_message = ""
+        if is_limit_exceeded:
+            response_message += f"File limit exceeded. "
         if is_time_limit_exceeded:
-            response_message = f"Time limit exceeded. "
+            response_message += f"Time limit exceeded. "
 
         response_message += f"{len(results)} file path{'s' if len(results) > 1 else ''} retrieved successfully."
 
@@ -239,7 +262,9 @@ def search_file_contents(
     Search each file in `file_paths` list for lines matching ANY of `regex_patterns`,
     Returns, for each file that matches, a list of line‑blocks (each block is
     up to `context_lines` before/after the match). If a file cannot be read,
-    its value is an error string.
+    its value is an error string. Binary files are reported as
+    "[Skipped: binary file]" and files larger than the configured
+    MAX_SCAN_FILE_SIZE as "[Skipped: file exceeds MAX_SCAN_FILE_SIZE]".
 
     Args:
         file_paths (list[str]): List of **actual file path** to search, not directory paths.
@@ -253,6 +278,9 @@ def search_file_contents(
             - 'time_elapsed': Time elapsed in seconds.
             - 'response_message': A message indicating the result of the operation
     """
+    error = _validate_regex_patterns(regex_patterns)
+    if error:
+        return return_message(results=None, success=False, response_message=error)
     file_paths = masker.unmask_multiple_paths(file_paths)
     try:
         query_result = file_search_tools.search_file_contents(file_paths, regex_patterns, context_lines, time_limit)
@@ -303,6 +331,9 @@ def list_file_and_search_file_contents(
             - 'time_elapsed': Time elapsed in seconds.
             - 'response_message': A message indicating the result of the operation
     """
+    error = _validate_regex_patterns(regex_patterns)
+    if error:
+        return return_message(results=None, success=False, response_message=error)
     base_dir = masker.unmask_path(base_dir)
     try:
         listing_query_result = file_search_tools.list_file_paths(base_dir, show_hidden, limit, time_limit, max_nested_level, "bfs", start_from, True, True)
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+
+from utils.file_search import FileSearchTool, _MMAP_MIN_SIZE
+
+
+class AnchoredPatternSizeBoundaryTest(unittest.TestCase):
+    """Anchored patterns must behave the same on both sides of _MMAP_MIN_SIZE.
+
+    Files at or above the threshold are scanned as one buffer with finditer;
+    smaller files are scanned line by line. ^/$ anchors must keep their
+    per-line meaning on both paths.
+    """
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = self._tmp.name
+        self.tool = FileSearchTool([self.base], [], hide_hidden=False)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write_lines(self, name: str, line_count: int) -> str:
+        path = os.path.join(self.base, name)
+        with open(path, "w") as f:
+            for i in range(line_count):
+                f.write(f"line {i} padding text\n")
+        return path
+
+    def test_anchored_pattern_matches_in_large_file(self):
+        path = self._write_lines("big.txt", 1000)
+        self.assertGreaterEqual(os.path.getsize(path), _MMAP_MIN_SIZE)
+        result = self.tool.search_file_contents([path], [r"^line 997\b"])
+        self.assertEqual(result["results"].get(path), ["line 997 padding text\n"])
+
+    def test_anchored_pattern_matches_in_small_file(self):
+        path = self._write_lines("small.txt", 100)
+        self.assertLess(os.path.getsize(path), _MMAP_MIN_SIZE)
+        result = self.tool.search_file_contents([path], [r"^line 97\b"])
+        self.assertEqual(result["results"].get(path), ["line 97 padding text\n"])
+
+    def test_end_anchor_matches_in_large_file(self):
+        path = self._write_lines("big2.txt", 1000)
+        result = self.tool.search_file_contents([path], [r"^line 997 \w+ text$"])
+        self.assertEqual(result["results"].get(path), ["line 997 padding text\n"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Any, Dict, List
+
+try:
+    # orjson parses JSON several times faster than the stdlib; fall back
+    # to json when it is not installed.
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+CONFIG_PATH = "config.json"
+
+
+@dataclass(frozen=True)
+class PathMaskerConfig:
+    ENABLED: bool = False
+    MODE: str = "prefix"
+    MASK_TOKEN: str = "MASK"
+    LOOK_FOR: List[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ServerConfig:
+    ALLOWED_PATHS: List[str]
+    EXCLUDE_PATHS: List[str] = field(default_factory=list)
+    DEFAULT_TIME_LIMIT: int = 10
+    HIDE_HIDDEN_FILES: bool = True
+    MAX_SCAN_FILE_SIZE: int = 52428800  # 50 MB, -1 = no limit
+    PATH_MASKER: PathMaskerConfig = field(default_factory=PathMaskerConfig)
+    HOST: str = "127.0.0.1"
+    PORT: int = 6277
+
+
+def _build_config(raw: Dict[str, Any]) -> ServerConfig:
+    """Validate the raw config dict and decode it into a typed ServerConfig."""
+    if not isinstance(raw, dict):
+        raise ValueError("config.json must contain a JSON object")
+    if not raw.get("ALLOWED_PATHS"):
+        raise ValueError("ALLOWED_PATHS must be specified in config.json")
+
+    masker_raw = raw.get("PATH_MASKER", {})
+    masker_keys = {f.name for f in fields(PathMaskerConfig)}
+    masker = PathMaskerConfig(**{k: v for k, v in masker_raw.items() if k in masker_keys})
+
+    known = {f.name for f in fields(ServerConfig)} - {"PATH_MASKER"}
+    return ServerConfig(PATH_MASKER=masker, **{k: v for k, v in raw.items() if k in known})
+
+
+@lru_cache(maxsize=1)
+def get_config() -> ServerConfig:
+    """Read, parse and validate config.json once per process."""
+    with open(CONFIG_PATH, "rb") as f:
+        return _build_config(_json.loads(f.read()))
@@ -1,36 +1,66 @@
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from pathlib import Path
-import fitz
-from docx import Document
-from docx.table import Table
-from docx.text.paragraph import Paragraph
 from typing import Union, List
-import pymupdf4llm
 import re
 
+# fitz (PyMuPDF), pymupdf4llm and python-docx are heavyweight imports that
+# dominate server cold-start; they are imported lazily inside the readers so
+# the cost is only paid when a PDF/DOCX is actually read.
+
+# Match ![](data:image/<type>;base64,...)
+_BASE64_IMG_RE = re.compile(r'!\[\]\(data:image\/[a-zA-Z]+;base64,[^\)]*\)')
+
+# pymupdf4llm's layout analysis is superlinear in the number of drawings per
+# page and can hang for tens of minutes on dense vector-heavy pages. Pages
+# past these thresholds skip markdown conversion and use plain text
+# extraction; the markdown call itself is also capped by a hard timeout.
+_PDF_MAX_PAGE_OBJECTS = 1000
+_PDF_MARKDOWN_TIMEOUT = 60  # seconds
+
+
+def _pdf_is_pathological(doc) -> bool:
+    """True when any page has enough images/drawings to risk a runaway markdown pass."""
+    try:
+        for page in doc:
+            if len(page.get_images()) > _PDF_MAX_PAGE_OBJECTS:
+                return True
+            if len(page.get_drawings()) > _PDF_MAX_PAGE_OBJECTS:
+                return True
+    except Exception:
+        return True
+    return False
+
+
 def remove_base64_images(markdown_text: str) -> str:
-    # Match ![](data:image/<type>;base64,...)
-    pattern = r'!\[\]\(data:image\/[a-zA-Z]+;base64,[^\)]*\)'
-    cleaned_text = re.sub(pattern, '![Image]', markdown_text)
-    return cleaned_text
+    return _BASE64_IMG_RE.sub('![Image]', markdown_text)
 
 def read_pdf(file_path: str, split_lines: bool = False, image_placeholder: bool = False) -> Union[str, List[str], List[List[str]]]:
+    import fitz
+    import pymupdf4llm
+
+    doc = fitz.open(file_path)
     try:
-        text = pymupdf4llm.to_markdown(
-            file_path,
-            embed_images=image_placeholder,
-            image_format="jpg",
-            image_path="assets/"
-        )
+        if _pdf_is_pathological(doc):
+            raise ValueError("object-heavy PDF; skipping markdown conversion")
+        # Run the markdown pass on a worker thread so a pathological file is
+        # abandoned after the timeout instead of blocking the request forever.
+        # shutdown(wait=False) leaves a stuck worker behind rather than
+        # joining it, which would reintroduce the hang.
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            text = pool.submit(
+                pymupdf4llm.to_markdown,
+                file_path,
+                embed_images=image_placeholder,
+                image_format="jpg",
+                image_path="assets/"
+            ).result(timeout=_PDF_MARKDOWN_TIMEOUT)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
         if image_placeholder:
             text = remove_base64_images(text)
-        if split_lines:
-            return [t for t in text.split("\n") if t.strip()]
-        return text
-    except Exception:
-        doc = fitz.open(file_path)
-        text = ""
-        for page in doc:
-            text += page.get_text()
+    except (Exception, FuturesTimeout):
+        text = "".join(page.get_text() for page in doc)
     if split_lines:
         return [t for t in text.split("\n") if t.strip()]
     return text
@@ -38,6 +68,9 @@ def read_pdf(file_path: str, split_lines: bool = False, image_placeholder: bool
 
 def docx_iter_block_items(parent):
     """Yield paragraphs and tables in the order they appear."""
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
     for child in parent.element.body:
         if child.tag.endswith('}p'):
             yield Paragraph(child, parent)
@@ -46,48 +79,38 @@ def docx_iter_block_items(parent):
 
 
 def read_docx(file_path: str, beautiful_table: bool = False, split_lines: bool = False) -> Union[str, List[str]]:
+    from docx import Document
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+
     doc = Document(file_path)
-    text = ""
-    table_placeholders: List[Tuple[str, Table]] = []
-    table_idx = 0
 
-    for block in docx_iter_block_items(doc):
-        if isinstance(block, Paragraph):
-            text += block.text + "\n"
-        elif isinstance(block, Table):
-            placeholder = f"__TABLE_PLACEHOLDER_{table_idx}__"
-            table_placeholders.append((placeholder, block))
-            text += f"{placeholder}\n"
-            table_idx += 1
+    def _format_table(table: Table) -> str:
+        table_rows = ["<table>"]
+        for row in table.rows:
+            cells = [cell.text.strip() for cell in row.cells]
+            table_rows.append(" | ".join(cells) if beautiful_table else str(cells))
+        table_rows.append("</table>")
+        return "\n".join(table_rows)
 
+    # Tables are formatted in place during the single pass over the document,
+    # so no placeholder bookkeeping or quadratic text.replace is needed.
     if split_lines:
-        result_lines = []
-        for line in text.splitlines():
-            found = False
-            for placeholder, table in table_placeholders:
-                if line.strip() == placeholder:
-                    found = True
-                    table_rows = ["<table>"]
-                    for row in table.rows:
-                        cells = [cell.text.strip() for cell in row.cells]
-                        row_text = " | ".join(cells) if beautiful_table else str(cells)
-                        table_rows.append(row_text)
-                    table_rows.append("</table>")
-                    result_lines.append("\n".join(table_rows))  # ← One chunk per table
-                    break
-            if not found and line.strip():
-                result_lines.append(line.strip())
+        result_lines: List[str] = []
+        for block in docx_iter_block_items(doc):
+            if isinstance(block, Paragraph):
+                for line in block.text.splitlines():
+                    line = line.strip()
+                    if line:
+                        result_lines.append(line)
+            elif isinstance(block, Table):
+                result_lines.append(_format_table(block))  # ← One chunk per table
         return result_lines
-    else:
-        for placeholder, table in table_placeholders:
-            table_rows = ["<table>"]
-            for row in table.rows:
-                cells = [cell.text.strip() for cell in row.cells]
-                row_text = " | ".join(cells) if beautiful_table else str(cells)
-                table_rows.append(row_text)
-            table_rows.append("</table>")
-            formatted_table = "\n".join(table_rows)
-            text = text.replace(placeholder, formatted_table)
-        return text.strip()
-
-    return text
\ No newline at end of file
+
+    parts: List[str] = []
+    for block in docx_iter_block_items(doc):
+        if isinstance(block, Paragraph):
+            parts.append(block.text)
+        elif isinstance(block, Table):
+            parts.append(_format_table(block))
+    return "\n".join(parts).strip()
\ No newline at end of file
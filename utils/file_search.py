@@ -1,59 +1,289 @@
-from pathlib import Path
-from typing import Optional, Literal, Any, Dict, List, Tuple
+from bisect import bisect_left
+from typing import Optional, Literal, Any, Dict, List, Tuple, Union
 import os
-from datetime import datetime
-from collections import deque
+import sys
+import time
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from functools import lru_cache
+import heapq
+import mmap
 import re
+import stat
+import threading
 import mimetypes
 
 
 from .file_reader import read_pdf, read_docx
-from .path import cleanup_path_list, is_hidden, path_startswith
+from .path import cleanup_path_list, is_hidden, build_prefix_set, is_under_any_prefix
 from .file_type import FileType
 
 
+try:
+    # Optional DFA-based engine (google-re2). Linear-time matching makes a big
+    # difference when scanning many files with multi-pattern alternations.
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
+
+# Files below this size are read through regular buffered I/O; mmap's setup
+# cost only pays off on larger files.
+_MMAP_MIN_SIZE = 16 * 1024
+
+# On POSIX "hidden" is purely a name convention, so traversal loops can test
+# entry.name directly instead of calling is_hidden per entry. Windows hidden
+# is a file attribute and still goes through is_hidden.
+_POSIX_HIDDEN_NAMES = os.name != "nt"
+
+
+def _advise_sequential(fd: int) -> None:
+    """Hint the kernel to prefetch the file for a sequential scan (no-op where unsupported)."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL | os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+
+
+def _read_text(path: str) -> str:
+    """Read a whole text file, memory-mapping it when large enough."""
+    if os.path.getsize(path) >= _MMAP_MIN_SIZE:
+        with open(path, "rb") as f:
+            _advise_sequential(f.fileno())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = mm[:]
+        return data.decode("utf-8", errors="replace")
+    # One raw read plus one decode; skips the TextIOWrapper/codec stack.
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8", errors="replace")
+
+
+def _match_line_stream(lines, literals, include_res, context_lines: int, deadline: Optional[float] = None) -> List[str]:
+    """
+    Stream lines through the matchers, emitting one ±context_lines block per
+    matching line. Keeps only a context_lines-sized ring buffer of prior
+    lines, so memory stays O(context_lines) regardless of file size.
+
+    Raises TimeoutError when `deadline` (a time.monotonic() timestamp) passes
+    mid-file; the check is throttled to every 1024 lines.
+    """
+    matches: List[Any] = []
+    before = deque(maxlen=context_lines) if context_lines > 0 else None
+    open_blocks: List[List[Any]] = []  # [lines_so_far, trailing_lines_still_needed]
+
+    empty: Any = ""
+    line_no = 0
+    for line in lines:
+        if line_no == 0:
+            # Works on str or bytes lines; blocks are joined with a matching
+            # empty separator.
+            empty = b"" if isinstance(line, bytes) else ""
+        line_no += 1
+        if deadline is not None and (line_no & 1023) == 0 and time.monotonic() > deadline:
+            raise TimeoutError("time limit exceeded while scanning")
+        # Feed trailing context into blocks opened by earlier matches.
+        for block in open_blocks:
+            block[0].append(line)
+            block[1] -= 1
+        while open_blocks and open_blocks[0][1] <= 0:
+            matches.append(empty.join(open_blocks.pop(0)[0]))
+
+        if any(lit in line for lit in literals) or any(r.search(line) for r in include_res):
+            block_lines = (list(before) if before is not None else []) + [line]
+            if context_lines > 0:
+                open_blocks.append([block_lines, context_lines])
+            else:
+                matches.append(empty.join(block_lines))
+
+        if before is not None:
+            before.append(line)
+
+    for block in open_blocks:
+        matches.append(empty.join(block[0]))
+    return matches
+
+
+def _combined_bytes_patterns(literals: List[str], include_res: List[re.Pattern]) -> List[re.Pattern]:
+    """Build bytes-mode matchers: literals fuse into one alternation, and the
+    already-compiled matchers are re-encoded as-is (fusion of the regex
+    patterns happened upstream in _compile_pattern_set). Everything compiles
+    with re.MULTILINE so ^/$ anchors keep their per-line meaning when matched
+    against a whole file buffer instead of one line at a time."""
+    patterns: List[re.Pattern] = []
+    if literals:
+        patterns.append(_compile_pattern("|".join(re.escape(lit) for lit in literals).encode("utf-8"), re.MULTILINE))
+    for r in include_res:
+        patterns.append(_compile_pattern(r.pattern.encode("utf-8"), re.MULTILINE))
+    return patterns
+
+
+def _scan_buffer(buf: bytes, patterns: List[re.Pattern], context_lines: int) -> List[str]:
+    """
+    Scan a whole file buffer with one finditer pass per matcher (no per-line
+    Python loop) and slice out ±context_lines blocks around each matching
+    line. Matches are mapped to line indices via bisect over precomputed
+    newline offsets, and at most one block is emitted per matching line, in
+    line order, mirroring the per-line scan.
+    """
+    if not patterns:
+        return []
+
+    newlines: List[int] = []
+    pos = buf.find(b"\n")
+    while pos != -1:
+        newlines.append(pos)
+        pos = buf.find(b"\n", pos + 1)
+
+    matched_lines = set()
+    for pattern in patterns:
+        for m in pattern.finditer(buf):
+            matched_lines.add(bisect_left(newlines, m.start()))
+
+    matches: List[str] = []
+    for line_idx in sorted(matched_lines):
+        start_line = line_idx - context_lines
+        end_line = line_idx + context_lines
+        start_off = 0 if start_line <= 0 else newlines[start_line - 1] + 1
+        end_off = len(buf) if end_line >= len(newlines) else newlines[end_line] + 1
+        matches.append(buf[start_off:end_off].decode("utf-8", errors="replace"))
+    return matches
+
+
+_REGEX_METACHARS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+def _is_literal_pattern(pattern: str) -> bool:
+    """True when the pattern contains no regex metacharacters.
+
+    Literal patterns can be matched with `in`, which is a C-level substring
+    search and much faster than the regex engine for the same query.
+    """
+    return _REGEX_METACHARS.search(pattern) is None
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: Union[str, bytes], flags: int = 0) -> re.Pattern:
+    """Compile a regex pattern, caching results across tool invocations."""
+    try:
+        return _regex_engine.compile(pattern, flags)
+    except Exception:
+        if _regex_engine is re:
+            raise
+        # re2 rejects some constructs (e.g. backreferences); fall back to re.
+        return re.compile(pattern, flags)
+
+
+# Constructs whose meaning changes (or that stop compiling) once a pattern is
+# embedded as one branch of a fused alternation: numbered and named
+# backreferences plus conditional groups (group numbers shift when branches
+# are concatenated), and global inline flags like (?i) (rejected anywhere but
+# the very start of an expression since Python 3.11).
+_UNFUSABLE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)")
+
+
+def _is_fusable_pattern(pattern: str) -> bool:
+    """True when the pattern can safely be one branch of a fused alternation."""
+    return _UNFUSABLE_RE.search(pattern) is None
+
+
+def _compile_pattern_set(patterns: List[str]) -> List[re.Pattern]:
+    """Compile patterns into as few matchers as possible.
+
+    Fusable patterns are joined into one alternation so each candidate is
+    scanned with a single C-level call; the rest are compiled individually.
+    If the engine rejects the fused form for any reason, every pattern falls
+    back to an individual matcher, preserving per-pattern semantics.
+    """
+    compiled = [_compile_pattern(p) for p in patterns if not _is_fusable_pattern(p)]
+    fusable = [p for p in patterns if _is_fusable_pattern(p)]
+    if fusable:
+        try:
+            compiled.append(_compile_pattern("|".join(f"(?:{p})" for p in fusable)))
+        except re.error:
+            compiled.extend(_compile_pattern(p) for p in fusable)
+    return compiled
+
+
 class FileSearchTool:
-    def __init__(self, allowed_paths: List[str], exclude_paths: List[str], hide_hidden: bool = True, default_time_limit: int = 10) -> None:
+    def __init__(self, allowed_paths: List[str], exclude_paths: List[str], hide_hidden: bool = True, default_time_limit: int = 10, max_scan_file_size: int = -1) -> None:
         self.allowed_paths = cleanup_path_list(allowed_paths)
         self.exclude_paths = cleanup_path_list(exclude_paths)
-        
+
+        # Deduplicated canonical prefixes, checked per discovered path.
+        self._allowed_prefixes = build_prefix_set(self.allowed_paths)
+        self._exclude_prefixes = build_prefix_set(self.exclude_paths)
+
         self._SHOW_HIDDEN = not hide_hidden
-        self._DEFAULT_TIME_LIMIT = default_time_limit        
+        self._DEFAULT_TIME_LIMIT = default_time_limit
+        self._MAX_SCAN_FILE_SIZE = max_scan_file_size
+
+        # Successful path resolutions, keyed by the raw input string. The
+        # same paths are re-resolved thousands of times during a tree walk
+        # and realpath costs one lstat per component.
+        self._resolve_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._RESOLVE_CACHE_SIZE = 4096
+
+        # Memoized is_allowed_path verdicts. Allowed/excluded/hidden status
+        # is stable for the life of the config, so repeat checks on the same
+        # path (symlink-heavy walks, repeated tool calls) skip the resolve.
+        self._allowed_cache: "OrderedDict[str, bool]" = OrderedDict()
+        self._ALLOWED_CACHE_SIZE = 16384
+
+        # LRU cache of list_file_paths results, invalidated by the base
+        # directory's mtime (part of the key).
+        self._list_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._LIST_CACHE_SIZE = 64
+
+        # The OrderedDict caches are mutated (move_to_end/popitem) from the
+        # scan worker threads and from concurrent tool calls; one lock keeps
+        # each hit/insert sequence atomic so an eviction on another thread
+        # can't race a move_to_end into a KeyError.
+        self._cache_lock = threading.Lock()
 
 
     def _resolve_path(self, rel_path: str, strict: bool = True) -> Optional[str]:
         if rel_path in ("", ".", "./"):
             rel_path = self.allowed_paths[0]  # default root
-            
-        # 1) Expand and resolve
-        p = Path(rel_path.strip()).expanduser()
+
+        # Only successful resolutions are cached, so the strict flag (which
+        # merely selects raise-vs-None on failure) is not part of the key.
+        with self._cache_lock:
+            cached = self._resolve_cache.get(rel_path)
+            if cached is not None:
+                self._resolve_cache.move_to_end(rel_path)
+                return cached
+
+        # 1) Expand and canonicalize. Symlinks must be resolved here — the
+        # prefix checks below gate on the canonical path — but realpath on
+        # plain strings skips pathlib's per-component object overhead, and
+        # resolving once (instead of resolve-then-re-resolve) halves the
+        # lstat walk.
+        cleaned = os.path.expanduser(rel_path.strip())
         candidate = None
-        if p.is_absolute():
-            candidate = p.resolve(strict=False)
+        if os.path.isabs(cleaned):
+            candidate = os.path.realpath(cleaned)
         else:
             # look for it under each allowed root
-            cand = None
             for root in self.allowed_paths:
-                cand = (Path(root) / p).resolve(strict=False)
-                if cand.exists():
+                cand = os.path.realpath(os.path.join(root, cleaned))
+                if os.path.exists(cand):
                     candidate = cand
                     break
 
-        if not candidate or not candidate.exists():
+        if not candidate or not os.path.exists(candidate):
             if not strict:
                 return None
             raise FileNotFoundError(f"Path `{rel_path}` not found in allowed directories.")
 
-        # 2) Canonicalize (resolve symlinks)
-        real = Path(candidate).resolve(strict=False)
-        real_str = str(real)
+        real_str = candidate
 
         # 3) Whitelist and blacklist checks
-        if not any(path_startswith(root, real_str) for root in self.allowed_paths):
+        if not is_under_any_prefix(real_str, self._allowed_prefixes):
             if not strict:
                 return None
             raise PermissionError(f"Access denied: `{real_str}` is outside allowed directories.")
-        if any(path_startswith(ex, real_str) for ex in self.exclude_paths):
+        if is_under_any_prefix(real_str, self._exclude_prefixes):
             if not strict:
                 return None
             raise PermissionError(f"Access denied: `{real_str}` is excluded.")
@@ -63,6 +293,11 @@ class FileSearchTool:
                 return None
             raise PermissionError(f"Access denied: `{real_str}` is hidden.")
 
+        with self._cache_lock:
+            self._resolve_cache[rel_path] = real_str
+            if len(self._resolve_cache) > self._RESOLVE_CACHE_SIZE:
+                self._resolve_cache.popitem(last=False)
+
         return real_str
 
 
@@ -77,14 +312,46 @@ class FileSearchTool:
     def is_allowed_path(self, path: str) -> bool:
         if not path:
             return False
+        with self._cache_lock:
+            cached = self._allowed_cache.get(path)
+            if cached is not None:
+                self._allowed_cache.move_to_end(path)
+                return cached
+        if not self._SHOW_HIDDEN and is_hidden(path):
+            allowed = False
+        else:
+            try:
+                _ = self._resolve_path(path, strict=True)
+                allowed = True
+            except FileNotFoundError:
+                # Transient: the path may appear later, so don't memoize.
+                return False
+            except PermissionError:
+                allowed = False
+        with self._cache_lock:
+            self._allowed_cache[path] = allowed
+            if len(self._allowed_cache) > self._ALLOWED_CACHE_SIZE:
+                self._allowed_cache.popitem(last=False)
+        return allowed
+  
+
+    def _fast_is_allowed(self, path: str, is_symlink: bool) -> bool:
+        """
+        Validation fast path for entries discovered while walking an
+        already-allowed directory. Such paths are canonical except when the
+        entry itself is a symlink, so the full _resolve_path machinery (and
+        its per-entry resolve syscalls) is only needed for symlinks.
+        """
+        if is_symlink:
+            return self.is_allowed_path(path)
         if not self._SHOW_HIDDEN and is_hidden(path):
             return False
-        try:
-            _ = self._resolve_path(path, strict=True)
-            return True
-        except (PermissionError, FileNotFoundError):
+        if not is_under_any_prefix(path, self._allowed_prefixes):
             return False
-  
+        if is_under_any_prefix(path, self._exclude_prefixes):
+            return False
+        return True
+
 
     def get_path_type(self, paths: List[str]) -> List[Tuple[str, str]]:
         """
@@ -108,12 +375,19 @@ class FileSearchTool:
                 return path, "[Unknown Error]"
             
             file_type = "unknown"
-            
-            if os.path.isdir(resolved_path):
+
+            # One lstat answers directory/symlink/file at once; the old
+            # isdir/islink/isfile chain cost up to three stat calls per path.
+            try:
+                mode = os.lstat(resolved_path).st_mode
+            except OSError:
+                return resolved_path, file_type
+
+            if stat.S_ISDIR(mode):
                 file_type = "directory"
-            elif os.path.islink(resolved_path):
+            elif stat.S_ISLNK(mode):
                 file_type = "symbolic link"
-            elif os.path.isfile(resolved_path):
+            elif stat.S_ISREG(mode):
                 file_type = "file"
                 try:
                     mime_type = mimetypes.guess_type(resolved_path)[0]
@@ -138,6 +412,7 @@ class FileSearchTool:
         start_from: int = 0,
         abs_path: bool = False,
         file_only: bool = False,
+        include_type: bool = False,
     ) -> Dict[str, Any]:
         """
         List file paths in the given directory, including directories and symbolic links.
@@ -152,6 +427,8 @@ class FileSearchTool:
             start_from (int): Starting index of files to return.
             abs_path (bool): If true, return absolute paths.
             file_only (bool): If true, only return files.
+            include_type (bool): If true, return (path, type) tuples. Types come
+                from the scandir entry, so classification costs no extra stat.
 
         Returns:
             Dict[str, Any]: Dict with:
@@ -170,77 +447,210 @@ class FileSearchTool:
             raise ValueError("base_dir cannot be empty.")
         
         base_dir = self._resolve_path(base_dir)
-        start_time = datetime.now()
-        results, count = [], 0
+
+        # Serve unchanged directories from the cache. The key includes the
+        # directory's mtime, which only reflects changes to its own entries —
+        # so caching is limited to single-level listings; recursive walks
+        # would go stale when a subdirectory changes without touching the
+        # root's mtime.
+        cache_key = None
+        if max_nested_level == 0:
+            try:
+                cache_key = (base_dir, os.stat(base_dir).st_mtime_ns, show_hidden, limit,
+                             search_mode, start_from, abs_path, file_only, include_type)
+            except OSError:
+                pass
+        if cache_key is not None:
+            with self._cache_lock:
+                cached = self._list_cache.get(cache_key)
+                if cached is not None:
+                    self._list_cache.move_to_end(cache_key)
+                    return {**cached, "time_elapsed": 0.0}
+
+        start_time = time.monotonic()
+        deadline = None if time_limit == -1 else start_time + time_limit
+        # Collected as (parent_dir, name) pairs with interned parents: entries
+        # sharing a directory share one parent string, and full paths are only
+        # materialized once at the API boundary below.
+        collected: List[Tuple[str, str]] = []
+        types: List[str] = []
+        count = 0
+        dirs_scanned = 0
         is_limit_exceeded = False
         is_time_limit_exceeded = False
 
-        # Initialize a queue or stack for BFS/DFS
-        # Each item is (directory_path, current_depth)
-        queue = deque([(base_dir, 0)])
-
-        while queue:
-            # Pop according to mode
-            current_dir, depth = (
-                queue.popleft() if search_mode == "bfs" else queue.pop()
-            )
-
-            # Respect depth limit (-1 means unlimited)
-            if max_nested_level >= 0 and depth > max_nested_level:
-                continue
-
+        def _scan_dir(d: str) -> List[os.DirEntry]:
+            # scandir serves is_dir/is_file from the directory read itself,
+            # avoiding an extra stat() per entry.
             try:
-                entries = os.listdir(current_dir)
+                with os.scandir(d) as it:
+                    if show_hidden:
+                        return list(it)
+                    if _POSIX_HIDDEN_NAMES:
+                        # Hidden is a pure name convention here; the slice test
+                        # skips a function call per entry.
+                        return [e for e in it if e.name[:1] != "."]
+                    return [e for e in it if not is_hidden(e.name)]
             except (PermissionError, FileNotFoundError):
-                continue
-
-            # Optionally skip hidden
-            entries = [e for e in entries if show_hidden or not is_hidden(e)]
-            entries.sort()
-
-            # Apply start_from only at the root level
-            if current_dir == base_dir and start_from > 0:
-                entries = entries[start_from:]
-
-            for name in entries:
-                full = os.path.join(current_dir, name)
-                if not self.is_allowed_path(full):
-                    continue
+                return []
 
-                # If it’s a directory, enqueue for further traversal
-                if os.path.isdir(full):
-                    if max_nested_level < 0 or depth < max_nested_level:
-                        queue.append((full, depth + 1))
-                    # If you only want files, skip adding dirs to results
-                    if file_only:
+        # Initialize a queue or stack for BFS/DFS
+        # Each item is (directory_path, current_depth). BFS drains whole
+        # levels from a deque; DFS uses a plain list, whose append/pop has
+        # the lowest constant overhead for stack use.
+        queue = deque([(base_dir, 0)]) if search_mode == "bfs" else [(base_dir, 0)]
+
+        # Locals for the per-entry loop: LOAD_FAST instead of attribute
+        # lookups on every iteration.
+        fast_is_allowed = self._fast_is_allowed
+        queue_append = queue.append
+        collected_append = collected.append
+        types_append = types.append
+        monotonic = time.monotonic
+
+        # Directory scans are pure I/O and release the GIL, so BFS drains one
+        # level at a time with the listings fetched concurrently. Entries are
+        # still consumed sequentially for deterministic results; DFS keeps the
+        # single-threaded pop order.
+        scan_pool = ThreadPoolExecutor(max_workers=16) if search_mode == "bfs" else None
+        try:
+            while queue:
+                if scan_pool is not None:
+                    level = list(queue)
+                    queue.clear()
+                    listings = zip(level, scan_pool.map(_scan_dir, (d for d, _ in level)))
+                else:
+                    item = queue.pop()
+                    listings = [(item, _scan_dir(item[0]))]
+
+                for (current_dir, depth), entries in listings:
+                    dirs_scanned += 1
+
+                    # Check the budget per directory too: a huge directory of
+                    # filtered-out entries would otherwise never hit the
+                    # throttled per-entry check below.
+                    if deadline is not None and time.monotonic() > deadline:
+                        is_time_limit_exceeded = True
+                        break
+                    # Respect depth limit (-1 means unlimited)
+                    if max_nested_level >= 0 and depth > max_nested_level:
                         continue
 
-                # If file_only is set, only include files
-                if file_only and not os.path.isfile(full):
-                    continue
+                    # Shallow limited listings only ever surface the first
+                    # limit+start_from names, so a partial selection
+                    # (O(N log k)) beats sorting millions of entries
+                    # (O(N log N)). The 4x margin keeps full sort for cases
+                    # where the crossover doesn't pay; symlinks fall back
+                    # because they can still fail the allow check and
+                    # under-fill the window.
+                    wanted = limit + start_from if limit > 0 else -1
+                    if (max_nested_level == 0 and not file_only
+                            and not self._exclude_prefixes
+                            and 0 < wanted and wanted * 4 < len(entries)):
+                        window = heapq.nsmallest(wanted, entries, key=lambda e: e.name)
+                        if any(e.is_symlink() for e in window):
+                            entries.sort(key=lambda e: e.name)
+                        else:
+                            entries = window
+                    else:
+                        entries.sort(key=lambda e: e.name)
+
+                    # Apply start_from only at the root level
+                    if current_dir == base_dir and start_from > 0:
+                        entries = entries[start_from:]
+
+                    parent_key = sys.intern(current_dir)
+                    for entry in entries:
+                        full = entry.path
+                        if not fast_is_allowed(full, entry.is_symlink()):
+                            continue
 
-                results.append(full if abs_path else os.path.relpath(full, base_dir))
-                count += 1
+                        # If it’s a directory, enqueue for further traversal
+                        if entry.is_dir(follow_symlinks=False):
+                            if max_nested_level < 0 or depth < max_nested_level:
+                                queue_append((full, depth + 1))
+                            # If you only want files, skip adding dirs to results
+                            if file_only:
+                                continue
 
-                if limit >= 0 and count >= limit:
-                    is_limit_exceeded = True
-                    break
+                        # If file_only is set, only include files
+                        if file_only and not entry.is_file():
+                            continue
 
-                if time_limit != -1 and (datetime.now() - start_time).total_seconds() > time_limit:
-                    is_time_limit_exceeded = True
-                    break
-            if is_limit_exceeded or is_time_limit_exceeded:
-                break
+                        collected_append((parent_key, entry.name))
+                        if include_type:
+                            # All served from the DirEntry's cached d_type.
+                            if entry.is_symlink():
+                                types_append("symbolic link")
+                            elif entry.is_dir(follow_symlinks=False):
+                                types_append("directory")
+                            elif entry.is_file(follow_symlinks=False):
+                                types_append("file")
+                            else:
+                                types_append("unknown")
+                        count += 1
 
-        results.sort()
+                        if limit >= 0 and count >= limit:
+                            is_limit_exceeded = True
+                            break
 
-        return {
+                        # Amortized deadline test: one clock read per 256
+                        # entries instead of per entry.
+                        if deadline is not None and (count & 0xFF) == 0 and monotonic() > deadline:
+                            is_time_limit_exceeded = True
+                            break
+                    if is_limit_exceeded or is_time_limit_exceeded:
+                        break
+                if is_limit_exceeded or is_time_limit_exceeded:
+                    break
+        finally:
+            if scan_pool is not None:
+                scan_pool.shutdown(wait=False)
+
+        # Parents are resolved directories, so joining is plain concatenation;
+        # os.path.join's special-casing costs a Python call per result.
+        sep = os.sep
+        if abs_path:
+            results = [
+                parent + name if parent.endswith(sep) else parent + sep + name
+                for parent, name in collected
+            ]
+        else:
+            # Every collected path descends from base_dir, so relpath is a
+            # prefix slice; os.path.relpath would abspath both arguments
+            # (hitting getcwd) per entry. Fall back only if a path escapes.
+            base_len = len(base_dir.rstrip(sep)) + 1
+            results = [
+                full[base_len:] if full.startswith(base_dir) else os.path.relpath(full, base_dir)
+                for full in (
+                    parent + name if parent.endswith(sep) else parent + sep + name
+                    for parent, name in collected
+                )
+            ]
+        if include_type:
+            results = list(zip(results, types))
+
+        if dirs_scanned > 1:
+            # Single-directory listings are already name-sorted by the
+            # per-directory entries.sort(); only multi-directory walks need
+            # the global O(N log N) pass to restore lexicographic order.
+            results.sort()
+
+        query_result = {
             "results": results,
-            "time_elapsed": (datetime.now() - start_time).total_seconds(),
+            "time_elapsed": time.monotonic() - start_time,
             "is_limit_exceeded": is_limit_exceeded,
             "is_time_limit_exceeded": is_time_limit_exceeded,
         }
 
+        if cache_key is not None and not is_time_limit_exceeded:
+            with self._cache_lock:
+                self._list_cache[cache_key] = query_result
+                if len(self._list_cache) > self._LIST_CACHE_SIZE:
+                    self._list_cache.popitem(last=False)
+
+        return query_result
+
 
     def search_file_name(
         self,
@@ -252,6 +662,7 @@ class FileSearchTool:
         max_nested_level: int = 1,
         abs_path: bool = False,
         search_mode: Literal["bfs", "dfs"] = "bfs",
+        limit: int = -1,
     ) -> Dict[str, Any]:
         """
         Search for files whose **path** match the given regex, level‑by‑level.
@@ -265,11 +676,14 @@ class FileSearchTool:
             max_nested_level (int): Depth to recurse: 0 = only root, 1 = root+its subdirs, -1 = unlimited.
             abs_path (bool): If True, return absolute paths.
             search_mode (Literal["bfs", "dfs"]): Search mode: "bfs" (recommended) or "dfs".
+            limit (int): Stop after this many matches (-1 = no limit). Matches
+                are taken in traversal order, then sorted.
 
         Returns:
             Dict[str, Any]: Dict with
                 - 'results': List of files matching regex. Sorted alphabetically.
                 - 'time_elapsed': Time elapsed in seconds.
+                - 'is_limit_exceeded': True if the limit was exceeded.
                 - 'is_time_limit_exceeded': True if the time limit was exceeded.
         """
         if time_limit is None:
@@ -287,72 +701,129 @@ class FileSearchTool:
             exclude_regex_patterns = []
         
         try:
-            pat = [re.compile(p) for p in regex_pattern]
+            # Validate individually for error reporting, then fuse the
+            # non-literal patterns where their constructs allow (literals go
+            # through plain substring search; backreferences and global
+            # inline flags keep their own matchers).
+            for p in regex_pattern:
+                _compile_pattern(p)
+            literals = [p for p in regex_pattern if _is_literal_pattern(p)]
+            non_literals = [p for p in regex_pattern if not _is_literal_pattern(p)]
+            pats = _compile_pattern_set(non_literals)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern in `regex_pattern`: {e}")
 
         try:
-            ex_pat = [re.compile(p) for p in exclude_regex_patterns]
+            for p in exclude_regex_patterns:
+                _compile_pattern(p)
+            ex_pats = _compile_pattern_set(exclude_regex_patterns)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern in `exclude_regex_patterns`: {e}")
 
         root = self._resolve_path(base_path)
-        
-        start_time = datetime.now()
-        
+        # Discovered paths descend from root, so relpath reduces to a prefix
+        # slice (os.path.relpath would abspath both arguments per hit).
+        root_len = len(root.rstrip(os.sep)) + 1
+
+        start_time = time.monotonic()
+        deadline = None if time_limit == -1 else start_time + time_limit
+
         results: list[str] = []
         queue = deque([(root, 0)]) if search_mode == "bfs" else [(root, 0)]  # (directory, current_level)
-        
-        while queue:
-            current_dir, level = queue.popleft() if search_mode == "bfs" else queue.pop()
-            
-            if any(p.search(current_dir) for p in ex_pat) or not self.is_allowed_path(current_dir):
-                continue  # skips everything for this directory
-            
-            # time‑quit check
-            if time_limit != -1 and (datetime.now() - start_time).total_seconds() > time_limit:
-                return {
-                    "results": results,
-                    "time_elapsed": (datetime.now() - start_time).total_seconds(),
-                    "is_time_limit_exceeded": True,
-                }
-            
+
+        def _scan(d: str) -> List[os.DirEntry]:
+            # scandir's DirEntry answers is_dir from the directory read
+            # itself, so classification costs no extra stat() per entry.
             try:
-                entries = os.listdir(current_dir)
+                with os.scandir(d) as it:
+                    return list(it)
             except (PermissionError, FileNotFoundError):
-                continue
-            
-            
-            for name in entries:
-                full_path = os.path.join(current_dir, name)
-                
-                if not self.is_allowed_path(full_path):
-                    continue
-                
-                # If it’s a file and matches, record it
+                return []
 
-                if not os.path.isdir(full_path):
-                    for p in pat:
-                        if not show_hidden and is_hidden(name):
+        def _skip_dir(d: str) -> bool:
+            return any(r.search(d) for r in ex_pats) or not self.is_allowed_path(d)
+
+        is_time_limit_exceeded = False
+        is_limit_exceeded = False
+        # Loop-invariant locals for the per-entry hot path.
+        fast_is_allowed = self._fast_is_allowed
+        queue_append = queue.append
+        results_append = results.append
+
+        # As in list_file_paths, BFS drains one level at a time with the
+        # listings fetched concurrently (scandir is pure I/O and releases the
+        # GIL); DFS keeps the single-threaded pop order.
+        scan_pool = ThreadPoolExecutor(max_workers=16) if search_mode == "bfs" else None
+        try:
+            while queue:
+                if scan_pool is not None:
+                    level_items = [item for item in queue if not _skip_dir(item[0])]
+                    queue.clear()
+                    listings = zip(level_items, scan_pool.map(_scan, (d for d, _ in level_items)))
+                else:
+                    item = queue.pop()
+                    if _skip_dir(item[0]):
+                        continue
+                    listings = [(item, _scan(item[0]))]
+
+                for (current_dir, level), entries in listings:
+                    # time‑quit check
+                    if deadline is not None and time.monotonic() > deadline:
+                        is_time_limit_exceeded = True
+                        break
+
+                    for entry in entries:
+                        full_path = entry.path
+                        name = entry.name
+
+                        if not fast_is_allowed(full_path, entry.is_symlink()):
                             continue
-                        if p.search(name):
-                            if abs_path:
-                                results.append(full_path)
-                            else:
-                                results.append(os.path.relpath(full_path, root))
-                            break
-                
-                # If it’s a directory and we haven’t hit max_nested_level, enqueue its contents
-                if os.path.isdir(full_path):
-                    if max_nested_level < 0 or level < max_nested_level:
-                        queue.append((full_path, level + 1))
-                        
-        
+
+                        is_dir = entry.is_dir(follow_symlinks=False)
+
+                        # If it’s a file and matches, record it
+                        if not is_dir:
+                            hidden = (name[:1] == ".") if _POSIX_HIDDEN_NAMES else is_hidden(name)
+                            if show_hidden or not hidden:
+                                if any(lit in name for lit in literals) or any(r.search(name) for r in pats):
+                                    if abs_path:
+                                        results_append(full_path)
+                                    else:
+                                        results_append(
+                                            full_path[root_len:] if full_path.startswith(root)
+                                            else os.path.relpath(full_path, root)
+                                        )
+                                    # Early termination: don't keep walking
+                                    # once the caller has enough matches.
+                                    if 0 <= limit <= len(results):
+                                        is_limit_exceeded = True
+                                        break
+
+                        # If it’s a directory and we haven’t hit max_nested_level, enqueue its contents
+                        elif max_nested_level < 0 or level < max_nested_level:
+                            queue_append((full_path, level + 1))
+                    if is_limit_exceeded:
+                        break
+                if is_time_limit_exceeded or is_limit_exceeded:
+                    break
+        finally:
+            if scan_pool is not None:
+                scan_pool.shutdown(wait=False)
+
+        if is_time_limit_exceeded:
+            return {
+                "results": results,
+                "time_elapsed": time.monotonic() - start_time,
+                "is_limit_exceeded": is_limit_exceeded,
+                "is_time_limit_exceeded": True,
+            }
+
         results.sort()
         
         return {
             "results": results,
-            "time_elapsed": (datetime.now() - start_time).total_seconds(),
+            "time_elapsed": time.monotonic() - start_time,
+            "is_limit_exceeded": is_limit_exceeded,
             "is_time_limit_exceeded": False,
         }
     
@@ -374,41 +845,51 @@ class FileSearchTool:
         if isinstance(file_paths, str):
             file_paths = [file_paths]
         
-        start_time = datetime.now()
+        start_time = time.monotonic()
 
-        results: Dict[str, Any] = {}
-        for file_path in file_paths:
+        def _read_one(file_path: str) -> Tuple[str, Any]:
             file_path = self._resolve_path(file_path, strict=False)
 
             if not self.is_allowed_path(file_path):
-                results[file_path] = "[Permission denied]"
-                continue
+                return file_path, "[Permission denied]"
 
             try:
                 mime_type = mimetypes.guess_type(file_path)[0]
                 if mime_type == FileType.PDF.value:
-                    results[file_path] = read_pdf(file_path)[:max_chars] if max_chars > 0 else read_pdf(file_path)
-                    continue
+                    content = read_pdf(file_path)
+                    return file_path, content[:max_chars] if max_chars > 0 else content
                 elif mime_type == FileType.DOCX.value:
-                    results[file_path] = read_docx(file_path)[:max_chars] if max_chars > 0 else read_docx(file_path)
-                    continue
+                    content = read_docx(file_path)
+                    return file_path, content[:max_chars] if max_chars > 0 else content
             except Exception:
                 pass
 
             try:
-                with open(file_path, "r", encoding="utf-8", errors="replace") as file:
-                    results[file_path] = file.read()[:max_chars] if max_chars > 0 else file.read()
+                content = _read_text(file_path)
+                return file_path, content[:max_chars] if max_chars > 0 else content
             except FileNotFoundError:
-                results[file_path] = "[File not found]"
+                return file_path, "[File not found]"
             except PermissionError:
-                results[file_path] = "[Permission denied]"
+                return file_path, "[Permission denied]"
             except Exception as e:
-                results[file_path] = f"[Error: {e}]"
-                
-                
+                return file_path, f"[Error: {e}]"
+
+        results: Dict[str, Any] = {}
+        if len(file_paths) <= 1:
+            for file_path in file_paths:
+                key, value = _read_one(file_path)
+                results[key] = value
+        else:
+            # File reads release the GIL, so batches overlap their I/O across
+            # threads; results are collected in submission order to keep the
+            # output deterministic.
+            with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+                for key, value in executor.map(_read_one, file_paths):
+                    results[key] = value
+
         return {
             "results": results,
-            "time_elapsed": (datetime.now() - start_time).total_seconds(),
+            "time_elapsed": time.monotonic() - start_time,
         }
 
 
@@ -440,77 +921,135 @@ class FileSearchTool:
         if time_limit is None:
             time_limit = self._DEFAULT_TIME_LIMIT
 
-        start_time = datetime.now()
+        start_time = time.monotonic()
         try:
-            include_re = [re.compile(p) for p in regex_patterns]
+            # Validate each pattern individually for clear error reporting,
+            # route literal patterns through plain substring search, and fuse
+            # the rest into as few alternations as their constructs allow so
+            # each line is scanned with a handful of C-level regex calls
+            # instead of N.
+            for p in regex_patterns:
+                _compile_pattern(p)
+            literals = [p for p in regex_patterns if _is_literal_pattern(p)]
+            non_literals = [p for p in regex_patterns if not _is_literal_pattern(p)]
+            include_res = _compile_pattern_set(non_literals)
         except re.error as e:
             raise ValueError(f"Invalid regex pattern in `regex_pattern`: {e}")
         
         results: Dict[str, Any] = {}
+        is_time_limit_exceeded = False
+        deadline = None if time_limit < 0 else time.monotonic() + time_limit
 
-        for rel_path in file_paths:
-            # --- Time limit check ---
-            if time_limit >= 0 and (datetime.now() - start_time).total_seconds() > time_limit:
-                # emit final status
-
-                return {
-                    "results": results,
-                    "time_elapsed": (datetime.now() - start_time).total_seconds(),
-                    "is_time_limit_exceeded": True,
-                }
-
-            abs_path = self._resolve_path(rel_path, strict=False)
-
-            if not self.is_allowed_path(abs_path):
-                results[abs_path] = "[Permission denied]"
-                continue
-            # --- Emit status per file ---
-
-
-            # --- Read file ---
-            matches = []
-
-            
-            try:
-                mime_type = mimetypes.guess_type(abs_path)[0]
-                if mime_type == FileType.PDF.value:
-                    lines = read_pdf(abs_path).split("\n")
-                elif mime_type == FileType.DOCX.value:
-                    lines = read_docx(abs_path).split("\n")
-                else:
-                    with open(abs_path, "r", encoding="utf-8", errors="replace") as f:
-                        lines = f.readlines()
-                        
-            except FileNotFoundError:
-                results[abs_path] = "[File not found]"
-                continue
-            except PermissionError:
-                results[abs_path] = "[Permission denied]"
-                continue
-            except IsADirectoryError:
-                results[abs_path] = "[Error: Is a directory. Please provide a file path.]"
-                continue
-            except Exception as e:
-                results[abs_path] = f"[Error: {e}]"
-                continue
+        # Scanning is I/O-bound and the regex engine releases the GIL, so
+        # distribute files across worker threads and collect in input order.
+        executor = ThreadPoolExecutor(max_workers=min(32, max(len(file_paths), 1)))
+        try:
+            pending = []
+            for rel_path in file_paths:
+                abs_path = self._resolve_path(rel_path, strict=False)
 
-            for idx, line in enumerate(lines):
-                if any(r.search(line) for r in include_re):
-                    start = max(0, idx - context_lines)
-                    end = min(len(lines), idx + context_lines + 1)
-                    block = "".join(lines[start:end])
-                    matches.append(block)
+                if not self.is_allowed_path(abs_path):
+                    pending.append((abs_path, None))
+                    continue
 
-            if matches:
-                results[abs_path] = matches
+                pending.append((abs_path, executor.submit(
+                    self._scan_single_file, abs_path, literals, include_res, context_lines, deadline
+                )))
 
-        # --- Final status emit ---
+            for abs_path, future in pending:
+                if future is None:
+                    results[abs_path] = "[Permission denied]"
+                    continue
 
+                try:
+                    if time_limit >= 0:
+                        remaining = time_limit - (time.monotonic() - start_time)
+                        if remaining <= 0:
+                            raise FuturesTimeout()
+                        matches = future.result(timeout=remaining)
+                    else:
+                        matches = future.result()
+                except (FuturesTimeout, TimeoutError):
+                    # _scan_single_file re-raises the builtin TimeoutError,
+                    # which is only an alias of FuturesTimeout on 3.11+;
+                    # catch both so 3.10 still reports partial results.
+                    is_time_limit_exceeded = True
+                    break
 
+                if matches is not None:
+                    results[abs_path] = matches
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
         return {
             "results": results,
-            "time_elapsed": (datetime.now() - start_time).total_seconds(),
-            "is_time_limit_exceeded": False,
+            "time_elapsed": time.monotonic() - start_time,
+            "is_time_limit_exceeded": is_time_limit_exceeded,
         }
+
+
+    def _scan_single_file(
+        self,
+        abs_path: str,
+        literals: List[str],
+        include_res: List[re.Pattern],
+        context_lines: int,
+        deadline: Optional[float] = None,
+    ) -> Any:
+        """
+        Scan one file for matching lines.
+
+        Returns a list of line blocks on matches, an error string when the
+        file cannot be read, or None when the file is readable but nothing
+        matched.
+        """
+        try:
+            mime_type = mimetypes.guess_type(abs_path)[0]
+            if mime_type == FileType.PDF.value:
+                matches = _match_line_stream(read_pdf(abs_path).split("\n"), literals, include_res, context_lines, deadline)
+            elif mime_type == FileType.DOCX.value:
+                matches = _match_line_stream(read_docx(abs_path).split("\n"), literals, include_res, context_lines, deadline)
+            else:
+                if self._MAX_SCAN_FILE_SIZE >= 0 and os.path.getsize(abs_path) > self._MAX_SCAN_FILE_SIZE:
+                    return "[Skipped: file exceeds MAX_SCAN_FILE_SIZE]"
+
+                with open(abs_path, "rb") as fb:
+                    # A NUL byte in the head is a cheap, reliable binary marker;
+                    # regex-scanning binaries is wasted work.
+                    if b"\x00" in fb.read(8192):
+                        return "[Skipped: binary file]"
+                    fb.seek(0)
+                    _advise_sequential(fb.fileno())
+                    if os.path.getsize(abs_path) >= _MMAP_MIN_SIZE:
+                        # Large files: one C-level finditer pass over the
+                        # mapped bytes instead of a per-line Python loop.
+                        with mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            buf = mm[:]
+                        matches = _scan_buffer(buf, _combined_bytes_patterns(literals, include_res), context_lines)
+                    else:
+                        # Small files: stream raw byte lines through
+                        # bytes-mode matchers, skipping the incremental
+                        # decoder entirely; only the matched blocks are
+                        # decoded.
+                        literals_b = [lit.encode("utf-8") for lit in literals]
+                        include_res_b = [
+                            _compile_pattern(r.pattern.encode("utf-8")) for r in include_res
+                        ]
+                        raw = _match_line_stream(fb, literals_b, include_res_b, context_lines, deadline)
+                        matches = [m.decode("utf-8", errors="replace") for m in raw]
+
+        except TimeoutError:
+            # Propagate so the collector reports is_time_limit_exceeded
+            # instead of recording this as a per-file error.
+            raise
+        except FileNotFoundError:
+            return "[File not found]"
+        except PermissionError:
+            return "[Permission denied]"
+        except IsADirectoryError:
+            return "[Error: Is a directory. Please provide a file path.]"
+        except Exception as e:
+            return f"[Error: {e}]"
+
+        return matches if matches else None
         
\ No newline at end of file
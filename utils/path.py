@@ -1,8 +1,20 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 import ctypes
 
+
+@lru_cache(maxsize=8192)
+def _resolve_cached(path: str) -> str:
+    """Resolve a path to its canonical absolute form, memoized.
+
+    Resolution lstats every component; callers like path_startswith hit the
+    same bases and targets repeatedly, so the cache removes almost all of
+    that syscall traffic.
+    """
+    return str(Path(path).resolve(strict=False).absolute())
+
 def pwd() -> str:
     current_dir = os.getcwd()
     if not os.path.exists(current_dir):
@@ -20,12 +32,9 @@ def path_startswith(base: str, target: str) -> bool:
     - Symlink resolution (if needed)
     """
     try:
-        base_path = Path(base).resolve(strict=False).absolute()
-        target_path = Path(target).resolve(strict=False).absolute()
-
         # Convert to string and normalize (handle case-insensitive on Windows)
-        base_str = str(base_path)
-        target_str = str(target_path)
+        base_str = _resolve_cached(base)
+        target_str = _resolve_cached(target)
 
         if os.name == "nt":  # Windows
             base_str = base_str.lower()
@@ -40,6 +49,39 @@ def path_startswith(base: str, target: str) -> bool:
         return False
 
 
+def _normalize_prefix(path: str) -> str:
+    p = str(path)
+    if os.name == "nt":
+        p = p.lower()
+    p = p.rstrip("\\/")
+    return p if p else os.sep
+
+
+def build_prefix_set(paths: List[str]) -> frozenset:
+    """Canonicalize paths into a frozenset of prefixes for is_under_any_prefix."""
+    return frozenset(_normalize_prefix(os.path.realpath(p)) for p in paths)
+
+
+def is_under_any_prefix(path: str, prefixes: frozenset) -> bool:
+    """
+    Check whether a canonical path equals or lies under any prefix in the set.
+
+    Walks up the path's parent chain, so the cost is O(path depth) set
+    lookups instead of a linear scan over every prefix. The caller is
+    expected to pass an already-resolved path.
+    """
+    if not prefixes:
+        return False
+    current = _normalize_prefix(path)
+    while True:
+        if current in prefixes:
+            return True
+        parent = os.path.dirname(current)
+        if parent == current:
+            return False
+        current = parent
+
+
 def is_path_excluded(path: str, exclude_paths: List[str]) -> bool:
     for exclude_path in exclude_paths:
         if path_startswith(exclude_path, path):
@@ -53,10 +95,11 @@ def cleanup_path_list(path_list: List[str]) -> List[str]:
     if not isinstance(path_list, list):
         raise ValueError("path_list must be a list")
 
+    # os.path primitives instead of pathlib: no per-item Path allocations.
     for path in path_list:
-        if not Path(path).exists():
+        if not os.path.exists(path):
             continue
-        cleaned_list.append(str(Path(path).resolve()))
+        cleaned_list.append(os.path.realpath(path))
     return cleaned_list
 
 
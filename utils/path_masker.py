@@ -1,8 +1,14 @@
-from pathlib import Path
 from typing import List, Tuple, Dict, Literal
 
 import os
-from .path import path_startswith
+import re
+
+try:
+    # Optional multi-pattern matcher: one pass over the path instead of one
+    # scan per LOOK_FOR entry.
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 def create_masked_map(
     look_for: List[str],
@@ -13,10 +19,10 @@ def create_masked_map(
     reversed_map = {}
     for idx, sensitive in enumerate(look_for):
         masked = f"[{mask_token}{idx}]"
-        full_path = str(Path(sensitive).resolve(strict=False))
+        full_path = os.path.realpath(sensitive)
         if os.name != "nt":
             full_path = full_path.rstrip("/")
-        key = full_path if mode == "prefix" else Path(full_path).name
+        key = full_path if mode == "prefix" else os.path.basename(full_path)
         masked_map[key] = masked
         reversed_map[masked] = key
     return masked_map, reversed_map
@@ -33,6 +39,36 @@ class PathMasker:
         self.enabled = enabled
         self.mode = mode
         self.masked_map, self.reversed_map = create_masked_map(look_for, mask_token, mode)
+        # Longest-first prefix list, computed once instead of on every mask_path call.
+        self._sorted_prefixes = sorted(self.masked_map.items(), key=lambda x: -len(x[0]))
+        # Compiled alternations: one C-level regex match per path instead of
+        # a Python-level loop over every prefix/token.
+        self._mask_re = None
+        self._unmask_re = None
+        if enabled and mode == "prefix" and self.masked_map:
+            boundary = f"(?={re.escape(os.sep)}|$)"
+            self._mask_re = re.compile(
+                "^(" + "|".join(re.escape(p) for p, _ in self._sorted_prefixes) + ")" + boundary
+            )
+            self._unmask_re = re.compile(
+                "^(" + "|".join(re.escape(m) for m in self.reversed_map) + ")" + boundary
+            )
+        self._automaton = None
+        if enabled and ahocorasick is not None and mode == "prefix" and self.masked_map:
+            automaton = ahocorasick.Automaton()
+            for original, masked in self.masked_map.items():
+                automaton.add_word(original, (original, masked))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+        if not enabled:
+            # Masking is off for the process lifetime: rebind the public
+            # methods to identity functions so every per-path call skips the
+            # enabled check and returns immediately.
+            self.mask_path = lambda path: path
+            self.unmask_path = lambda path: path
+            self.mask_multiple_paths = list
+            self.unmask_multiple_paths = list
 
     def mask_path(self, path: str) -> str:
         if not self.enabled:
@@ -42,9 +78,23 @@ class PathMasker:
             path = path.rstrip("/")
 
         if self.mode == "prefix":
-            for original, masked in sorted(self.masked_map.items(), key=lambda x: -len(x[0])):
-                if path_startswith(original, path):
-                    return path.replace(original, masked, 1)
+            if self._automaton is not None:
+                best = None
+                for end, (original, masked) in self._automaton.iter(path):
+                    # Only matches anchored at the start of the path and ending
+                    # on a path boundary count as prefixes.
+                    if end - len(original) + 1 != 0:
+                        continue
+                    if len(path) != len(original) and path[len(original)] != os.sep:
+                        continue
+                    if best is None or len(original) > len(best[0]):
+                        best = (original, masked)
+                if best is not None:
+                    return path.replace(best[0], best[1], 1)
+                return path
+            m = self._mask_re.match(path) if self._mask_re else None
+            if m:
+                return self.masked_map[m.group(1)] + path[m.end():]
             return path
 
         elif self.mode == "segment":
@@ -58,9 +108,9 @@ class PathMasker:
         if not self.enabled:
             return path
         if self.mode == "prefix":
-            for masked, original in self.reversed_map.items():
-                if path_startswith(masked, path):
-                    return path.replace(masked, original, 1)
+            m = self._unmask_re.match(path) if self._unmask_re else None
+            if m:
+                return self.reversed_map[m.group(1)] + path[m.end():]
             return path
 
         elif self.mode == "segment":
@@ -71,8 +121,10 @@ class PathMasker:
             return os.sep.join(unmasked_parts)
 
     def mask_multiple_paths(self, paths: List[str]) -> List[str]:
-        return [self.mask_path(path) for path in paths]
+        # map over the bound method runs the loop in C, avoiding a Python
+        # frame per element on large result lists.
+        return list(map(self.mask_path, paths))
 
     def unmask_multiple_paths(self, paths: List[str]) -> List[str]:
-        return [self.unmask_path(path) for path in paths]
+        return list(map(self.unmask_path, paths))
         
\ No newline at end of file